@@ -8,16 +8,21 @@ st.set_page_config(
 )
 
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import json
 import asyncio
 import time
 import threading
-import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import re
+import html
+import gzip
+import base64
 import pandas as pd
 import csv
 import random
@@ -43,6 +48,71 @@ except ImportError:
     FAKER_AVAILABLE = False
     st.sidebar.warning("📦 Install 'faker' for enhanced test data generation: `pip install faker`")
 
+# Load orjson for faster JSON serialization (optional dependency)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_default(value):
+    """Serialize numpy scalars (e.g. from CSV rows) as plain numbers, like orjson does, and anything else as str"""
+    if type(value).__module__ == 'numpy' and hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+def _dumps_bytes(obj, indent=False):
+    """Serialize obj to UTF-8 encoded JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option, default=_json_default)
+    return json.dumps(obj, indent=2 if indent else None, default=_json_default).encode('utf-8')
+
+def _dumps(obj, indent=False):
+    """Serialize obj to a JSON string, using orjson when available"""
+    return _dumps_bytes(obj, indent).decode('utf-8')
+
+def _loads(content):
+    """Parse JSON from bytes or str, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
+
+# Load httpx for HTTP/2 JIRA requests (optional dependency, needs the h2 extra)
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# OS file-manager command used by the "Open" buttons
+_OS = platform.system()
+_OPENER = {"Darwin": "open", "Windows": "explorer"}.get(_OS, "xdg-open")
+
+def _open_in_file_manager(path) -> bool:
+    """Open a directory in the OS file manager without blocking; False if it does not exist"""
+    if not path or not os.path.isdir(path):
+        return False
+    subprocess.Popen([_OPENER, str(path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    return True
+
+# Precompiled patterns for extracting test steps from generated test cases
+_STEPS_RE = re.compile(r"Test Steps:\s*(.*?)(?=Expected Result:|Priority:|Test Type:|$)", re.DOTALL | re.IGNORECASE)
+_STEP_START_RE = re.compile(r'^(?:\d|[-•]\s)')
+_NUM_RE = re.compile(r'^\d+\.?\s*')
+_BULLET_RE = re.compile(r'^[-•]\s*')
+
+def _iter_steps(steps_text):
+    """Yield cleaned numbered/bulleted steps from a Test Steps section"""
+    for line in steps_text.splitlines():
+        line = line.strip()
+        if not line or not _STEP_START_RE.match(line):
+            continue
+        cleaned_step = _BULLET_RE.sub('', _NUM_RE.sub('', line))  # Remove numbering and bullet points
+        if cleaned_step:
+            yield cleaned_step
+
 class TestDataManager:
     """Manage test data generation from both Faker and CSV sources"""
     
@@ -50,8 +120,12 @@ class TestDataManager:
         self.fake = Faker() if FAKER_AVAILABLE else None
         self.csv_data = None
         self.current_row_index = 0
+        self.total_rows = 0
+        self.preview_df = None
+        self.csv_file_id = None
         
-    def detect_feature_type(self, title, description):
+    @staticmethod
+    def detect_feature_type(title, description):
         """Detect the type of feature based on title and description"""
         text = (title + " " + description).lower()
         
@@ -77,7 +151,9 @@ class TestDataManager:
         try:
             self.csv_data = pd.read_csv(uploaded_file)
             self.current_row_index = 0
-            return True, f"✅ Loaded {len(self.csv_data)} rows of test data"
+            self.total_rows = len(self.csv_data)
+            self.preview_df = self.csv_data.head(3)
+            return True, f"✅ Loaded {self.total_rows} rows of test data"
         except Exception as e:
             return False, f"❌ Error loading CSV: {str(e)}"
     
@@ -161,14 +237,14 @@ class TestDataManager:
     
     def get_csv_data_row(self, row_index=None):
         """Get a specific row from CSV data or next row cyclically"""
-        if self.csv_data is None or len(self.csv_data) == 0:
+        if self.csv_data is None or self.total_rows == 0:
             return {}
             
         if row_index is None:
             row_index = self.current_row_index
-            self.current_row_index = (self.current_row_index + 1) % len(self.csv_data)
+            self.current_row_index = (self.current_row_index + 1) % self.total_rows
         
-        row_index = row_index % len(self.csv_data)
+        row_index = row_index % self.total_rows
         return self.csv_data.iloc[row_index].to_dict()
     
     def get_test_data(self, feature_type, data_mode='faker', row_index=None):
@@ -188,7 +264,8 @@ class TestDataManager:
                 'feature_type': feature_type
             }
     
-    def create_sample_csv_template(self):
+    @staticmethod
+    def create_sample_csv_template():
         """Create a sample CSV template for users"""
         sample_data = {
             'email': ['test1@example.com', 'test2@example.com', 'test3@example.com'],
@@ -207,6 +284,11 @@ class TestDataManager:
         df = pd.DataFrame(sample_data)
         return df
 
+@st.cache_data(show_spinner=False)
+def _sample_csv_bytes() -> bytes:
+    """Serialized sample CSV template, built once per process (no Faker-backed manager needed)"""
+    return TestDataManager.create_sample_csv_template().to_csv(index=False).encode('utf-8')
+
 class PlaywrightCodeGenerator:
     """Generate optimized Playwright test scripts from automation results"""
     
@@ -395,7 +477,7 @@ test.describe('{test_suite_name}', () => {{
                 elif isinstance(value, (int, float)):
                     test_data_setup += f"    const {clean_key} = {value};\n"
                 elif isinstance(value, list):
-                    test_data_setup += f"    const {clean_key} = {json.dumps(value)};\n"
+                    test_data_setup += f"    const {clean_key} = {_dumps(value)};\n"
             test_data_setup += "\n"
         
         # Generate test steps
@@ -665,16 +747,80 @@ export default defineConfig({
             'actions_optimized': len(optimized_actions)
         }
 
+# Stateless generator shared by all test runners
+_PW_GEN = PlaywrightCodeGenerator()
+
+# Retry policy for throttled/5xx JIRA responses, shared by both HTTP clients
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.3  # seconds, doubled per attempt
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS", "TRACE"})  # urllib3's idempotent defaults
+
+@st.cache_resource(show_spinner=False)
+def _jira_session():
+    """Pooled requests session with retries, built once per process so keep-alive connections survive reruns"""
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=_RETRY_TOTAL, backoff_factor=_RETRY_BACKOFF, status_forcelist=list(_RETRY_STATUSES), raise_on_status=False)
+    ))
+    return session
+
+_JIRA_TIMEOUT = (5, 30)  # (connect, read) seconds
+
+@st.cache_resource(show_spinner=False)
+def _jira_http_client():
+    """HTTP/2 client that multiplexes concurrent JIRA requests, built once per process (None without httpx)"""
+    if not HTTPX_AVAILABLE:
+        return None
+    return httpx.Client(
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        follow_redirects=True,  # Match requests' default
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=_RETRY_TOTAL,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        )
+    )
+
+def _httpx_request_with_retries(client, method, url, **kwargs):
+    """Send an httpx request, retrying throttled/5xx responses with the same policy as _jira_session"""
+    # httpx transport retries only cover connection failures; like urllib3's Retry,
+    # only idempotent methods are retried and a numeric Retry-After is honored
+    attempt = 0
+    while True:
+        response = client.request(method, url, **kwargs)
+        if (response.status_code not in _RETRY_STATUSES or attempt >= _RETRY_TOTAL
+                or method.upper() not in _RETRY_METHODS):
+            return response
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else _RETRY_BACKOFF * (2 ** attempt)
+        response.close()
+        time.sleep(delay)
+        attempt += 1
+
+def _jira_request(method, url, auth, headers, **kwargs):
+    """Send a JIRA API request over HTTP/2 when httpx is installed, else the pooled requests session"""
+    client = _jira_http_client()
+    if client is not None:
+        return _httpx_request_with_retries(client, method, url, auth=auth, headers=headers, **kwargs)
+    return _jira_session().request(method, url, auth=auth, headers=headers, timeout=_JIRA_TIMEOUT, **kwargs)
+
+def _error_body(response, limit=500):
+    """Decode the start of an error response body as UTF-8, skipping charset detection"""
+    return response.content[:limit].decode('utf-8', errors='replace')
+
 def get_issue_types(base_url, username, api_key, project_key):
     """Get available issue types for the project"""
     url = f"{base_url}/rest/api/3/project/{project_key}"
-    auth = HTTPBasicAuth(username, api_key)
+    auth = (username, api_key)
     headers = {"Accept": "application/json"}
     
     try:
-        response = requests.get(url, headers=headers, auth=auth)
+        response = _jira_request("GET", url, auth, headers)
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response.content)
             issue_types = [it["name"] for it in data.get("issueTypes", [])]
             return issue_types, None
         else:
@@ -685,7 +831,7 @@ def get_issue_types(base_url, username, api_key, project_key):
 def create_jira_issue(base_url, username, api_key, project_key, feature_title, feature_description, module, complexity, issue_type="Task"):
     """Create a new JIRA issue"""
     url = f"{base_url}/rest/api/3/issue"
-    auth = HTTPBasicAuth(username, api_key)
+    auth = (username, api_key)
     headers = {
         "Accept": "application/json",
         "Content-Type": "application/json"
@@ -720,27 +866,36 @@ def create_jira_issue(base_url, username, api_key, project_key, feature_title, f
     }
     
     try:
-        response = requests.post(url, headers=headers, auth=auth, data=json.dumps(payload))
+        response = _jira_request("POST", url, auth, headers, json=payload)
         if response.status_code == 201:
-            data = response.json()
+            data = _loads(response.content)
             issue_key = data["key"]
             return issue_key, payload, None
         else:
-            error_msg = f"Error creating issue: {response.status_code} - {response.text}"
+            error_msg = f"Error creating issue: {response.status_code} - {_error_body(response)}"
             return None, None, error_msg
     except Exception as e:
         return None, None, f"Exception occurred: {str(e)}"
 
+def _adf_text(node, out):
+    """Collect text nodes from an Atlassian Document Format tree in document order"""
+    if isinstance(node, dict):
+        text = node.get("text")
+        if text:
+            out.append(text)
+        for child in node.get("content") or ():
+            _adf_text(child, out)
+
 def fetch_jira_issue(base_url, username, api_key, issue_id):
     """Fetch JIRA issue details using the API"""
     url = f"{base_url}/rest/api/3/issue/{issue_id}"
-    auth = HTTPBasicAuth(username, api_key)
+    auth = (username, api_key)
     headers = {"Accept": "application/json"}
     
     try:
-        response = requests.get(url, headers=headers, auth=auth)
+        response = _jira_request("GET", url, auth, headers)
         if response.status_code == 200:
-            data = response.json()
+            data = _loads(response.content)
             summary = data["fields"]["summary"]
             
             # Handle description safely (it might be None or have different structure)
@@ -748,14 +903,9 @@ def fetch_jira_issue(base_url, username, api_key, issue_id):
             if data["fields"].get("description"):
                 if isinstance(data["fields"]["description"], dict):
                     # New Atlassian Document Format (ADF)
-                    content = data["fields"]["description"].get("content", [])
                     description_parts = []
-                    for content_block in content:
-                        if content_block.get("content"):
-                            for text_block in content_block["content"]:
-                                if text_block.get("text"):
-                                    description_parts.append(text_block["text"])
-                    description = " ".join(description_parts) if description_parts else "No description available"
+                    _adf_text(data["fields"]["description"], description_parts)
+                    description = " ".join(description_parts) or "No description available"
                 else:
                     # Plain text description
                     description = data["fields"]["description"]
@@ -764,11 +914,14 @@ def fetch_jira_issue(base_url, username, api_key, issue_id):
             
             return summary, description, None
         else:
-            error_msg = f"Error fetching issue: {response.status_code} - {response.text}"
+            error_msg = f"Error fetching issue: {response.status_code} - {_error_body(response)}"
             return None, None, error_msg
     except Exception as e:
         return None, None, f"Exception occurred: {str(e)}"
 
+_SIMPLE_TYPES = (str, int, float)
+_SIMPLE_OR_LIST_TYPES = _SIMPLE_TYPES + (list,)
+
 def generate_test_case(issue_id, summary, description, test_data=None):
     """Generate a manual test case based on the JIRA issue with test data"""
     
@@ -776,20 +929,32 @@ def generate_test_case(issue_id, summary, description, test_data=None):
     test_data_section = ""
     if test_data and test_data.get('data'):
         data_source = test_data.get('source', 'unknown')
-        test_data_section = f"""
+        parts = [f"""
 Test Data (Source: {data_source.upper()}):
-"""
+"""]
         data = test_data['data']
         for key, value in data.items():
-            if isinstance(value, (str, int, float)):
-                test_data_section += f"  - {key}: {value}\n"
-            elif isinstance(value, list):
-                test_data_section += f"  - {key}: {', '.join(map(str, value))}\n"
+            # Exact type check first: test data values are almost always plain str/int/float/list
+            tv = type(value)
+            if tv in _SIMPLE_TYPES:
+                parts.append(f"  - {key}: {value}\n")
+            elif tv is list:
+                parts.append(f"  - {key}: {', '.join(map(str, value))}\n")
+            elif isinstance(value, _SIMPLE_OR_LIST_TYPES):
+                # Rare subclasses (e.g. numpy floats): one isinstance check covers all four types
+                if isinstance(value, list):
+                    parts.append(f"  - {key}: {', '.join(map(str, value))}\n")
+                else:
+                    parts.append(f"  - {key}: {value}\n")
+        test_data_section = "".join(parts)
     
     # Generate more specific test steps based on feature type
     feature_type = test_data.get('feature_type', 'generic') if test_data else 'generic'
     specific_steps = generate_feature_specific_steps(feature_type, summary, test_data)
     
+    desc_trunc = description[:300]
+    desc_suffix = '...' if len(description) > 300 else ''
+    
     return f"""=== Manual Test Case ===
 Test Case ID: TC_{issue_id}
 Title: {summary}
@@ -800,7 +965,7 @@ Test Steps:
 {specific_steps}
 
 Expected Result:
-  The system should behave as described in: {description[:300]}{'...' if len(description) > 300 else ''}
+  The system should behave as described in: {desc_trunc}{desc_suffix}
 
 Priority: Medium
 Test Type: Manual
@@ -813,20 +978,16 @@ Notes:
 - Review and modify as needed before execution
 """
 
-def generate_feature_specific_steps(feature_type, summary, test_data=None):
-    """Generate feature-specific test steps based on the feature type"""
-    
-    if feature_type == 'login':
-        return """  1. Navigate to the login page
+# Feature-specific manual test steps, keyed by detected feature type
+_FEATURE_STEPS = {
+    'login': """  1. Navigate to the login page
   2. Enter valid email/username from test data
   3. Enter valid password from test data
   4. Click the login button
   5. Verify successful login and redirection
   6. Test with invalid credentials (negative testing)
-  7. Verify appropriate error messages are displayed"""
-    
-    elif feature_type == 'registration':
-        return """  1. Navigate to the registration page
+  7. Verify appropriate error messages are displayed""",
+    'registration': """  1. Navigate to the registration page
   2. Fill in first name from test data
   3. Fill in last name from test data
   4. Enter email address from test data
@@ -835,30 +996,24 @@ def generate_feature_specific_steps(feature_type, summary, test_data=None):
   7. Fill additional required fields
   8. Submit the registration form
   9. Verify successful registration confirmation
-  10. Test with invalid data (negative testing)"""
-    
-    elif feature_type == 'product':
-        return """  1. Navigate to the product catalog/search page
+  10. Test with invalid data (negative testing)""",
+    'product': """  1. Navigate to the product catalog/search page
   2. Search for products using test data
   3. Filter by category from test data
   4. Select a product to view details
   5. Verify product information matches expected data
   6. Add product to cart with specified quantity
   7. Verify cart updates correctly
-  8. Test product sorting and filtering options"""
-    
-    elif feature_type == 'search':
-        return """  1. Navigate to the search functionality
+  8. Test product sorting and filtering options""",
+    'search': """  1. Navigate to the search functionality
   2. Enter search query from test data
   3. Execute the search
   4. Verify search results are displayed
   5. Test different search terms from test data
   6. Apply filters if available
   7. Test search with empty/invalid queries
-  8. Verify search result accuracy and relevance"""
-    
-    elif feature_type == 'contact':
-        return """  1. Navigate to the contact/feedback form
+  8. Verify search result accuracy and relevance""",
+    'contact': """  1. Navigate to the contact/feedback form
   2. Fill in name from test data
   3. Enter email address from test data
   4. Fill in phone number from test data
@@ -866,10 +1021,8 @@ def generate_feature_specific_steps(feature_type, summary, test_data=None):
   6. Fill in message from test data
   7. Submit the form
   8. Verify submission confirmation
-  9. Test form validation with invalid data"""
-    
-    elif feature_type == 'payment':
-        return """  1. Navigate to the payment/checkout page
+  9. Test form validation with invalid data""",
+    'payment': """  1. Navigate to the payment/checkout page
   2. Enter billing information from test data
   3. Fill in credit card details from test data
   4. Enter cardholder name from test data
@@ -877,81 +1030,253 @@ def generate_feature_specific_steps(feature_type, summary, test_data=None):
   6. Enter billing address from test data
   7. Submit payment information
   8. Verify payment processing
-  9. Test with invalid payment data"""
-    
-    elif feature_type == 'profile':
-        return """  1. Navigate to the user profile page
+  9. Test with invalid payment data""",
+    'profile': """  1. Navigate to the user profile page
   2. Update profile information using test data
   3. Fill in bio/description from test data
   4. Update contact information
   5. Set preferences and settings
   6. Save profile changes
   7. Verify changes are persisted
-  8. Test profile picture upload if applicable"""
-    
-    else:  # generic
-        return """  1. Navigate to the relevant page/section
+  8. Test profile picture upload if applicable""",
+    'generic': """  1. Navigate to the relevant page/section
   2. Identify the main functionality to test
   3. Use test data to fill any required forms/fields
   4. Perform the primary action (submit, save, etc.)
   5. Verify the expected behavior occurs
   6. Test edge cases and error conditions
   7. Validate data persistence and display"""
+}
+
+def generate_feature_specific_steps(feature_type, summary, test_data=None):
+    """Generate feature-specific test steps based on the feature type"""
+    return _FEATURE_STEPS.get(feature_type, _FEATURE_STEPS['generic'])
 
 def save_test_case(test_case, issue_id):
     """Save test case to file"""
     filename = f"TestCase_{issue_id}.txt"
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(test_case)
+        data = test_case.encode("utf-8")
+        with open(filename, "wb") as f:
+            f.write(data)
         return filename, None
     except Exception as e:
         return None, f"Error saving file: {str(e)}"
 
+def fetch_and_generate_many(base_url, username, api_key, issue_ids, workers=8, test_data=None):
+    """Fetch several JIRA issues concurrently and generate a test case for each
+
+    Returns a dict mapping each issue ID (in input order) to a
+    (test_case, error) tuple.
+    """
+    issue_ids = list(dict.fromkeys(issue_ids))
+    if not issue_ids:
+        return {}
+    
+    def fetch_and_generate(issue_id):
+        summary, description, error = fetch_jira_issue(base_url, username, api_key, issue_id)
+        if error:
+            return None, error
+        return generate_test_case(issue_id, summary, description, test_data), None
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(len(issue_ids), workers, 16)) as executor:
+        futures = {executor.submit(fetch_and_generate, issue_id): issue_id for issue_id in issue_ids}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    return {issue_id: results[issue_id] for issue_id in issue_ids}
+
+# Static tail of every automation task prompt
+_AUTOMATION_INSTRUCTIONS = """
+
+AUTOMATION INSTRUCTIONS:
+- Use the test data provided above for filling forms, login, registration, etc.
+- For email fields: Use 'email' from test data
+- For username fields: Use 'username' or 'login_username' from test data
+- For password fields: Use 'password' from test data
+- For name fields: Use 'first_name' and 'last_name' from test data
+- For phone fields: Use 'phone' from test data
+- For search fields: Use 'search_query' or 'search_terms' from test data
+- For product fields: Use 'product_name', 'quantity', 'price' from test data
+- For contact forms: Use 'subject', 'message', 'inquiry_type' from test data
+- Take screenshots before and after each major action
+- If authentication is required, try the provided credentials first
+- Document any fields that couldn't be filled and why
+- Handle error messages and validation responses
+- Capture the final state and any success/error messages
+
+IMPORTANT:
+- Always use the test data provided above rather than random values
+- If a field type is not covered in test data, document this in results
+- Take extra screenshots when forms are filled or submitted
+- Test both valid and invalid scenarios when possible
+"""
+
+# Static skeleton for the HTML automation report
+_REPORT_TEMPLATE = string.Template("""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Test Automation Report - $report_name</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+            margin: 0;
+            padding: 20px;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.15);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 40px;
+            text-align: center;
+        }
+        .mode-badge {
+            background: $mode_color;
+            color: $badge_text_color;
+            padding: 8px 16px;
+            border-radius: 20px;
+            font-size: 0.9em;
+            font-weight: bold;
+            margin-top: 10px;
+            display: inline-block;
+        }
+        .section {
+            padding: 30px;
+            border-bottom: 1px solid #eee;
+        }
+        .section:last-child {
+            border-bottom: none;
+        }
+        .task-content {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 10px;
+            border-left: 4px solid #667eea;
+            white-space: pre-wrap;
+            font-family: 'Courier New', monospace;
+            margin: 20px 0;
+        }
+        .result-content {
+            background: #e8f5e8;
+            padding: 20px;
+            border-radius: 10px;
+            border-left: 4px solid #28a745;
+            white-space: pre-wrap;
+            font-family: 'Courier New', monospace;
+            margin: 20px 0;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🤖 Test Automation Report</h1>
+            <h2>$report_name</h2>
+            <div class="mode-badge">$mode_badge</div>
+            <p>Generated on $generated_on</p>
+        </div>
+        
+        <div class="section">
+            <h3>🎯 Test Target</h3>
+            <p><strong>URL:</strong> <a href="$url" target="_blank">$url</a></p>
+            <p><strong>Executed:</strong> $executed_at</p>
+        </div>
+        
+        <div class="section">
+            <h3>📋 Automation Task</h3>
+            <div class="task-content">$automation_task</div>
+        </div>
+        
+        <div class="section">
+            <h3>📊 Results</h3>
+            <div class="result-content">$result</div>
+        </div>
+        
+        <div class="section">
+            <h3>📁 Report Files</h3>
+            <ul>
+                <li>📄 <strong>$report_name.html</strong> - This test report</li>
+                <li>📁 <strong>Location:</strong> $report_dir</li>
+            </ul>
+        </div>
+    </div>
+</body>
+</html>""")
+
+@st.cache_resource(show_spinner=False)
+def _get_async_loop():
+    """Return the agent event loop, started once per process on a daemon thread and shared by all sessions"""
+    # Module globals are rebuilt on every rerun of this script; cache_resource is what makes this process-wide
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
 class BrowserTestRunner:
     """Browser automation runner for executing test steps"""
     
+    # browser-use classes, imported once on first automation run
+    _agent_cls = None
+    _llm_cls = None
+    _import_checked = False
+    
     def __init__(self):
-        self.result_queue = queue.Queue()
-        self.status_queue = queue.Queue()
+        self._status_buf = deque(maxlen=256)
+        self._result_buf = deque(maxlen=1)
+        self._buf_lock = threading.Lock()
         self.running = False
         self.thread = None
         self.current_report_dir = None
-        self.playwright_generator = PlaywrightCodeGenerator()
+        self.playwright_generator = _PW_GEN
         
-    def extract_test_steps(self, test_case_content):
+    @classmethod
+    def _load_browser_use(cls):
+        """Import browser-use on first call and report whether it is available"""
+        if not cls._import_checked:
+            try:
+                from browser_use import Agent
+                from browser_use.llm.deepseek.chat import ChatDeepSeek
+                cls._agent_cls, cls._llm_cls = Agent, ChatDeepSeek
+            except ImportError:
+                pass
+            cls._import_checked = True
+        return cls._agent_cls is not None
+        
+    @staticmethod
+    def extract_test_steps(test_case_content):
         """Extract actionable test steps from test case content"""
         # Look for test steps section
-        steps_pattern = r"Test Steps:\s*(.*?)(?=Expected Result:|Priority:|Test Type:|$)"
-        match = re.search(steps_pattern, test_case_content, re.DOTALL | re.IGNORECASE)
-        
-        if not match:
-            return []
-            
-        steps_text = match.group(1).strip()
-        
-        # Extract numbered steps
-        step_lines = []
-        for line in steps_text.split('\n'):
-            line = line.strip()
-            if line and (line[0].isdigit() or line.startswith('- ') or line.startswith('• ')):
-                # Clean up the step
-                cleaned_step = re.sub(r'^\d+\.?\s*', '', line)  # Remove numbering
-                cleaned_step = re.sub(r'^[-•]\s*', '', cleaned_step)  # Remove bullet points
-                if cleaned_step:
-                    step_lines.append(cleaned_step)
-        
-        return step_lines
+        match = _STEPS_RE.search(test_case_content)
+        return list(_iter_steps(match.group(1))) if match else []
     
-    def convert_test_steps_to_automation_task(self, test_steps, feature_title, url="https://example.com", test_data=None):
-        """Convert test steps into browser automation instructions with test data"""
+    @staticmethod
+    def convert_test_steps_to_automation_task(test_steps, feature_title, url="https://example.com", test_data=None, data_json=None):
+        """Convert test steps into browser automation instructions with test data
+
+        data_json may carry an already indented serialization of test_data['data'].
+        """
         
         # Prepare test data section
         test_data_section = ""
         if test_data and test_data.get('data'):
+            if data_json is None:
+                data_json = _dumps(test_data['data'], indent=True)
             test_data_section = f"""
 AVAILABLE TEST DATA ({test_data.get('source', 'unknown').upper()} SOURCE):
-{json.dumps(test_data['data'], indent=2)}
+{data_json}
 
 """
         
@@ -974,41 +1299,15 @@ Navigate to {url} and execute the following test steps for feature: {feature_tit
 {test_data_section}DETAILED TEST STEPS:
 """
         
-        for i, step in enumerate(test_steps, 1):
-            automation_task += f"\n{i}. {step}"
-            
-        automation_task += f"""
-
-AUTOMATION INSTRUCTIONS:
-- Use the test data provided above for filling forms, login, registration, etc.
-- For email fields: Use 'email' from test data
-- For username fields: Use 'username' or 'login_username' from test data
-- For password fields: Use 'password' from test data
-- For name fields: Use 'first_name' and 'last_name' from test data
-- For phone fields: Use 'phone' from test data
-- For search fields: Use 'search_query' or 'search_terms' from test data
-- For product fields: Use 'product_name', 'quantity', 'price' from test data
-- For contact forms: Use 'subject', 'message', 'inquiry_type' from test data
-- Take screenshots before and after each major action
-- If authentication is required, try the provided credentials first
-- Document any fields that couldn't be filled and why
-- Handle error messages and validation responses
-- Capture the final state and any success/error messages
-
-IMPORTANT:
-- Always use the test data provided above rather than random values
-- If a field type is not covered in test data, document this in results
-- Take extra screenshots when forms are filled or submitted
-- Test both valid and invalid scenarios when possible
-"""
+        steps_block = "".join(f"\n{i}. {step}" for i, step in enumerate(test_steps, 1))
         
-        return automation_task.strip()
+        return "".join([automation_task, steps_block, _AUTOMATION_INSTRUCTIONS]).strip()
     
-    def run_browser_automation(self, url, automation_task, api_key, headless=True, test_data=None):
+    def run_browser_automation(self, url, automation_task, api_key, headless=True, test_data=None, data_json=None):
         """Run browser automation in a separate thread"""
         def run_in_thread():
             try:
-                self.status_queue.put("🔧 Initializing browser automation...")
+                self._put_status("🔧 Initializing browser automation...")
                 
                 # Create report directory
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1016,61 +1315,56 @@ IMPORTANT:
                 self.current_report_dir = Path("automation_reports") / report_name
                 self.current_report_dir.mkdir(parents=True, exist_ok=True)
                 
-                self.status_queue.put(f"📁 Created report directory: {report_name}")
+                self._put_status(f"📁 Created report directory: {report_name}")
                 
                 # Save test data to report directory
                 if test_data:
                     test_data_file = self.current_report_dir / "test_data.json"
-                    test_data_file.write_text(json.dumps(test_data, indent=2), encoding='utf-8')
-                    self.status_queue.put(f"💾 Test data saved: {len(test_data.get('data', {}))} data fields")
+                    test_data_file.write_bytes(_dumps_bytes(test_data, indent=True))
+                    self._put_status(f"💾 Test data saved: {len(test_data.get('data', {}))} data fields")
                 
-                try:
-                    # Try to import browser-use
-                    from browser_use import Agent
-                    from browser_use.llm.deepseek.chat import ChatDeepSeek
-                    browser_available = True
-                    self.status_queue.put("✅ Browser automation library loaded")
-                except ImportError as e:
-                    browser_available = False
-                    self.status_queue.put("⚠️ Browser automation not available, running in demo mode")
+                browser_available = self._load_browser_use()
+                if browser_available:
+                    self._put_status("✅ Browser automation library loaded")
+                else:
+                    self._put_status("⚠️ Browser automation not available, running in demo mode")
                 
                 if browser_available:
-                    self.status_queue.put("🤖 Setting up AI agent...")
-                    llm = ChatDeepSeek(
+                    self._put_status("🤖 Setting up AI agent...")
+                    llm = self._llm_cls(
                         model='deepseek-chat',
                         api_key=api_key
                     )
                     
                     if headless:
-                        self.status_queue.put("🌐 Starting browser (headless mode)...")
+                        self._put_status("🌐 Starting browser (headless mode)...")
                     else:
-                        self.status_queue.put("🌐 Starting visible browser - watch your screen! 👁️")
+                        self._put_status("🌐 Starting visible browser - watch your screen! 👁️")
                     
-                    agent = Agent(
+                    agent = self._agent_cls(
                         task=automation_task,
                         llm=llm,
                         headless=headless
                     )
                     
                     if headless:
-                        self.status_queue.put("⚡ Executing test automation in background...")
+                        self._put_status("⚡ Executing test automation in background...")
                     else:
-                        self.status_queue.put("⚡ Executing test automation - you can watch the browser! 🔍")
+                        self._put_status("⚡ Executing test automation - you can watch the browser! 🔍")
                     
                     # Run the automation
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    result = loop.run_until_complete(agent.run())
+                    future = asyncio.run_coroutine_threadsafe(agent.run(), _get_async_loop())
+                    result = future.result()
                     
-                    self.status_queue.put("✅ Test automation completed!")
+                    self._put_status("✅ Test automation completed!")
                     
                 else:
                     # Demo mode
-                    self.status_queue.put("🔧 Running in demo mode with test data...")
-                    result = self.run_demo_automation(url, automation_task, test_data)
+                    self._put_status("🔧 Running in demo mode with test data...")
+                    result = self.run_demo_automation(url, automation_task, test_data, data_json)
                 
                 # Generate report
-                self.status_queue.put("📄 Generating test report...")
+                self._put_status("📄 Generating test report...")
                 report_path = self.generate_test_report(url, automation_task, result, report_name, browser_available)
                 
                 # Generate Playwright scripts after successful automation
@@ -1083,7 +1377,7 @@ IMPORTANT:
                     str(result), test_name, url, test_data
                 )
                 
-                self.result_queue.put({
+                self._put_result({
                     "success": True,
                     "result": result,
                     "report_path": str(report_path) if report_path else None,
@@ -1094,8 +1388,8 @@ IMPORTANT:
                 })
                 
             except Exception as e:
-                self.status_queue.put(f"❌ Error: {str(e)}")
-                self.result_queue.put({
+                self._put_status(f"❌ Error: {str(e)}")
+                self._put_result({
                     "success": False,
                     "error": str(e)
                 })
@@ -1104,12 +1398,14 @@ IMPORTANT:
         
         if not self.running:
             self.running = True
+            with self._buf_lock:
+                self._result_buf.clear()  # Never report an unclaimed earlier result as this run's
             self.thread = threading.Thread(target=run_in_thread)
             self.thread.start()
             return True
         return False
     
-    def run_demo_automation(self, url, automation_task, test_data=None):
+    def run_demo_automation(self, url, automation_task, test_data=None, data_json=None):
         """Run demo automation with simulated steps and test data"""
         demo_steps = [
             "🌐 Navigating to target URL...",
@@ -1123,9 +1419,15 @@ IMPORTANT:
             "✅ Test execution completed with data validation!"
         ]
         
+        # Optional per-step pause so the simulated progress can be watched in the UI
+        delay = float(os.getenv("DEMO_STEP_DELAY", "0"))
         for step in demo_steps:
-            self.status_queue.put(step)
-            time.sleep(2)
+            self._put_status(step)
+            if delay:
+                time.sleep(delay)
+        
+        if data_json is None:
+            data_json = _dumps(test_data.get('data', {}), indent=True) if test_data else "No test data provided"
         
         test_data_summary = ""
         if test_data:
@@ -1153,7 +1455,7 @@ Simulated Test Execution with Data:
 7. Generated comprehensive test results
 
 Test Data Applied:
-{json.dumps(test_data.get('data', {}), indent=2) if test_data else "No test data provided"}
+{data_json}
 
 Status: Completed (Enhanced Demo Mode)
 Note: This is a demonstration with test data integration. Install browser-use and configure DeepSeek API for real automation."""
@@ -1161,131 +1463,47 @@ Note: This is a demonstration with test data integration. Install browser-use an
     def generate_test_report(self, url, automation_task, result, report_name, real_mode=True):
         """Generate HTML test report"""
         try:
-            mode_badge = "REAL AUTOMATION" if real_mode else "DEMO MODE"
-            mode_color = "#28a745" if real_mode else "#ffc107"
-            
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Test Automation Report - {report_name}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-            margin: 0;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.15);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        .mode-badge {{
-            background: {mode_color};
-            color: {'white' if real_mode else '#212529'};
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-size: 0.9em;
-            font-weight: bold;
-            margin-top: 10px;
-            display: inline-block;
-        }}
-        .section {{
-            padding: 30px;
-            border-bottom: 1px solid #eee;
-        }}
-        .section:last-child {{
-            border-bottom: none;
-        }}
-        .task-content {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 10px;
-            border-left: 4px solid #667eea;
-            white-space: pre-wrap;
-            font-family: 'Courier New', monospace;
-            margin: 20px 0;
-        }}
-        .result-content {{
-            background: #e8f5e8;
-            padding: 20px;
-            border-radius: 10px;
-            border-left: 4px solid #28a745;
-            white-space: pre-wrap;
-            font-family: 'Courier New', monospace;
-            margin: 20px 0;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🤖 Test Automation Report</h1>
-            <h2>{report_name}</h2>
-            <div class="mode-badge">{mode_badge}</div>
-            <p>Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
-        </div>
-        
-        <div class="section">
-            <h3>🎯 Test Target</h3>
-            <p><strong>URL:</strong> <a href="{url}" target="_blank">{url}</a></p>
-            <p><strong>Executed:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-        
-        <div class="section">
-            <h3>📋 Automation Task</h3>
-            <div class="task-content">{automation_task}</div>
-        </div>
-        
-        <div class="section">
-            <h3>📊 Results</h3>
-            <div class="result-content">{str(result)}</div>
-        </div>
-        
-        <div class="section">
-            <h3>📁 Report Files</h3>
-            <ul>
-                <li>📄 <strong>{report_name}.html</strong> - This test report</li>
-                <li>📁 <strong>Location:</strong> {self.current_report_dir}</li>
-            </ul>
-        </div>
-    </div>
-</body>
-</html>"""
+            now = datetime.now()
+            html_content = _REPORT_TEMPLATE.substitute(
+                report_name=html.escape(report_name),
+                mode_badge="REAL AUTOMATION" if real_mode else "DEMO MODE",
+                mode_color="#28a745" if real_mode else "#ffc107",
+                badge_text_color="white" if real_mode else "#212529",
+                generated_on=now.strftime('%B %d, %Y at %I:%M %p'),
+                executed_at=now.strftime('%Y-%m-%d %H:%M:%S'),
+                url=html.escape(url),
+                automation_task=html.escape(automation_task),
+                result=html.escape(str(result)),
+                report_dir=html.escape(str(self.current_report_dir))
+            )
             
             report_path = self.current_report_dir / f"{report_name}.html"
-            report_path.write_text(html_content, encoding='utf-8')
+            report_path.write_bytes(html_content.encode('utf-8'))
             return report_path
             
         except Exception as e:
             print(f"Error generating report: {e}")
             return None
     
+    def _put_status(self, message):
+        """Publish a status update for the UI"""
+        with self._buf_lock:
+            self._status_buf.append(message)
+    
+    def _put_result(self, result):
+        """Publish the final automation result for the UI"""
+        with self._buf_lock:
+            self._result_buf.append(result)
+    
     def get_status(self):
         """Get current status update"""
-        try:
-            return self.status_queue.get_nowait()
-        except queue.Empty:
-            return None
+        with self._buf_lock:
+            return self._status_buf.popleft() if self._status_buf else None
     
     def generate_playwright_scripts(self, automation_result: str, test_name: str, test_url: str, test_data: Dict = None) -> Dict[str, str]:
         """Generate optimized Playwright scripts from automation results"""
         try:
-            self.status_queue.put("🎭 Generating Playwright test scripts...")
+            self._put_status("🎭 Generating Playwright test scripts...")
             
             # Generate the complete test suite
             playwright_files = self.playwright_generator.generate_optimized_test_suite(
@@ -1297,18 +1515,11 @@ Note: This is a demonstration with test data integration. Install browser-use an
                 playwright_dir = self.current_report_dir / "playwright_tests"
                 playwright_dir.mkdir(exist_ok=True)
                 
-                # Save test file
+                # Test file goes straight into the tests directory
+                tests_dir = playwright_dir / "tests"
+                tests_dir.mkdir(exist_ok=True)
                 test_file_name = f"{test_name.lower().replace(' ', '_').replace('-', '_')}.spec.ts"
-                test_file = playwright_dir / test_file_name
-                test_file.write_text(playwright_files['test_suite'], encoding='utf-8')
-                
-                # Save package.json
-                package_file = playwright_dir / "package.json"
-                package_file.write_text(playwright_files['package_json'], encoding='utf-8')
-                
-                # Save playwright config
-                config_file = playwright_dir / "playwright.config.ts"
-                config_file.write_text(playwright_files['playwright_config'], encoding='utf-8')
+                final_test_file = tests_dir / test_file_name
                 
                 # Create README with instructions
                 readme_content = f"""# Auto-Generated Playwright Tests
@@ -1387,22 +1598,22 @@ Modify the test files as needed for your specific application:
 *Generated from JIRA issue test automation results on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
 """
                 
-                readme_file = playwright_dir / "README.md"
-                readme_file.write_text(readme_content, encoding='utf-8')
-                
-                # Create tests directory
-                tests_dir = playwright_dir / "tests"
-                tests_dir.mkdir(exist_ok=True)
-                
-                # Move test file to tests directory
-                final_test_file = tests_dir / test_file_name
-                final_test_file.write_text(playwright_files['test_suite'], encoding='utf-8')
-                test_file.unlink()  # Remove the original file
+                # Write all package files concurrently
+                writes = [
+                    (final_test_file, playwright_files['test_suite']),
+                    (playwright_dir / "package.json", playwright_files['package_json']),
+                    (playwright_dir / "playwright.config.ts", playwright_files['playwright_config']),
+                    (playwright_dir / "README.md", readme_content),
+                ]
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    list(executor.map(lambda item: item[0].write_bytes(item[1].encode('utf-8')), writes))
                 
-                self.status_queue.put(f"✅ Playwright scripts generated in: {playwright_dir}")
+                self._put_status(f"✅ Playwright scripts generated in: {playwright_dir}")
                 
+                # File contents stay on disk; session state only keeps the counts and paths
                 return {
-                    **playwright_files,
+                    'actions_extracted': playwright_files['actions_extracted'],
+                    'actions_optimized': playwright_files['actions_optimized'],
                     'directory': str(playwright_dir),
                     'test_file_path': str(final_test_file),
                     'files_created': [
@@ -1416,15 +1627,312 @@ Modify the test files as needed for your specific application:
             return playwright_files
             
         except Exception as e:
-            self.status_queue.put(f"❌ Error generating Playwright scripts: {str(e)}")
+            self._put_status(f"❌ Error generating Playwright scripts: {str(e)}")
             return None
 
     def get_result(self):
         """Get automation result"""
-        try:
-            return self.result_queue.get_nowait()
-        except queue.Empty:
-            return None
+        with self._buf_lock:
+            return self._result_buf.popleft() if self._result_buf else None
+
+@st.cache_data(show_spinner=False)
+def _detect_feature_type(summary: str, description: str) -> str:
+    """Detect the feature type, cached per summary and description"""
+    return TestDataManager.detect_feature_type(summary, description)
+
+@st.cache_data(show_spinner=False)
+def _build_automation_task(test_case, summary, url, data_json, data_source, _test_data):
+    """Build the browser automation prompt, cached per test case, URL and serialized data (_test_data is not hashed)"""
+    test_steps = BrowserTestRunner.extract_test_steps(test_case)
+    return BrowserTestRunner.convert_test_steps_to_automation_task(test_steps, summary, url, _test_data, data_json)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_issue_types(base_url, username, api_key, project_key):
+    """Fetch a project's issue types, cached for five minutes; raises on error so failures are not cached"""
+    issue_types, error = get_issue_types(base_url, username, api_key, project_key)
+    if error:
+        raise RuntimeError(error)
+    return issue_types
+
+# Bounds for the process-wide file caches below; each regenerated file (new mtime) adds an entry
+_FILE_CACHE_ENTRIES = 16
+_FILE_CACHE_TTL = 3600  # seconds
+
+# Reports above this size are shipped gzip-compressed and inflated in the browser
+_GZIP_EMBED_MIN_BYTES = 256 * 1024
+_GZIP_EMBED_TEMPLATE = string.Template("""<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head><body>
+<script>
+const bytes = Uint8Array.from(atob("$payload"), c => c.charCodeAt(0));
+new Response(new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip")))
+    .text()
+    .then(html => { document.open(); document.write(html); document.close(); });
+</script>
+</body></html>""")
+
+@st.cache_data(show_spinner=False, max_entries=_FILE_CACHE_ENTRIES, ttl=_FILE_CACHE_TTL)
+def _load_report_embed(path: str, mtime_ns: int) -> str:
+    """Return a report's HTML for embedding, gzip-wrapped when large; cached per path and modification time"""
+    raw = Path(path).read_bytes()
+    if len(raw) <= _GZIP_EMBED_MIN_BYTES:
+        return raw.decode('utf-8')
+    payload = base64.b64encode(gzip.compress(raw, compresslevel=6)).decode('ascii')
+    return _GZIP_EMBED_TEMPLATE.substitute(payload=payload)
+
+@st.cache_data(show_spinner=False, max_entries=_FILE_CACHE_ENTRIES, ttl=_FILE_CACHE_TTL)
+def _load_report_bytes(path: str, mtime_ns: int) -> bytes:
+    """Read a report or generated test file, cached per path and modification time"""
+    return Path(path).read_bytes()
+
+@st.cache_data(show_spinner=False, max_entries=_FILE_CACHE_ENTRIES, ttl=_FILE_CACHE_TTL)
+def _load_pw_preview(path: str, mtime_ns: int, limit: int = 2000) -> str:
+    """Read just the head of a generated Playwright spec for the code preview"""
+    with open(path, 'r', encoding='utf-8') as f:
+        preview = f.read(limit)
+    return preview + "\n\n# ... (truncated for preview)"
+
+def _stat_or_none(path):
+    """Return os.stat(path), or None if the file is missing"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+def _scan_reports(reports_dir):
+    """Yield (folder DirEntry, first HTML DirEntry or None) for each report folder in one pass"""
+    # DirEntry.is_dir()/is_file() reuse the file type from the directory listing instead of a stat per entry
+    with os.scandir(reports_dir) as folders:
+        for folder in folders:
+            if not folder.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(folder.path) as entries:
+                html_entry = next(
+                    (e for e in entries if e.name.endswith(".html") and e.is_file(follow_symlinks=False)),
+                    None
+                )
+            yield folder, html_entry
+
+def _list_reports(reports_dir):
+    """Map report folder names (newest first) to (folder path, HTML path, HTML size), cached until the directory changes"""
+    mtime_ns = reports_dir.stat().st_mtime_ns
+    if st.session_state.get('_reports_mtime') != mtime_ns:
+        reports = {}
+        for folder, html_entry in sorted(_scan_reports(reports_dir), key=lambda r: r[0].name, reverse=True):
+            if html_entry is not None:
+                reports[folder.name] = (folder.path, html_entry.path, html_entry.stat().st_size)
+            else:
+                reports[folder.name] = (folder.path, None, None)
+        st.session_state['_reports_cache'] = reports
+        st.session_state['_reports_mtime'] = mtime_ns
+    return st.session_state['_reports_cache']
+
+# Static markdown shown after a Playwright suite is generated and at the bottom of the page
+_QUICK_START_MD = """
+**🚀 Quick Start with Generated Tests:**
+
+1. **Navigate to the Playwright directory** (use button above)
+2. **Install dependencies**: `npm install && npx playwright install`
+3. **Run tests**: `npm test` (headless) or `npm run test:headed` (visible)
+4. **Debug tests**: `npm run test:debug` or `npm run test:ui` (interactive)
+5. **View reports**: `npm run test:report`
+
+💡 **The generated tests include:**
+- Data-driven test scenarios using your test data
+- Edge case and negative testing scenarios
+- Cross-browser compatibility (Chrome, Firefox, Safari)
+- Mobile testing (Chrome Mobile, Safari Mobile)
+- Screenshots and video recording on failures
+- CI/CD ready configuration with best practices
+"""
+
+_FOOTER_MD = """
+### 🤖 **Features:**
+- ✅ **Create JIRA Issues** - Generate issues from feature descriptions
+- ✅ **Auto-Generate Test Cases** - Create structured manual test cases
+- ✅ **Browser Automation** - Execute test steps automatically with BrowserClark
+- ✅ **🔍 Visual Browser Mode** - Watch the browser in real-time during testing
+- ✅ **Real-time Status** - Live updates during automation
+- ✅ **Detailed Reports** - Comprehensive HTML reports with screenshots
+
+### 🔧 **Requirements:**
+- **JIRA API Token** - For issue creation and fetching
+- **DeepSeek API Key** - For AI-powered browser automation
+- **Target URL** - Website where tests will be executed
+
+### 👁️ **Browser Visibility:**
+- **🔍 Show Browser**: Watch the automation happen in real-time (great for debugging)
+- **⚡ Headless Mode**: Faster execution with browser running in background
+
+💡 **Tip**: Use "Show Browser" mode to see exactly what the AI is doing on your website!
+
+*Built with Streamlit & BrowserClark* 🚀
+"""
+
+# Per-run state that can be dropped once a run's results are no longer needed
+_RUN_ARTIFACT_DEFAULTS = {
+    'automation_result': None,
+    'show_report_tab1': False,
+    'current_report_path_tab1': None,
+    'show_report_tab2': False,
+    'current_report_path_tab2': None,
+    'sidebar_show_report': False,
+    'sidebar_report_path': None,
+}
+
+def _clear_run_artifacts():
+    """Reset this session's per-run state (the report caches are shared across sessions and left alone)"""
+    for key, default in _RUN_ARTIFACT_DEFAULTS.items():
+        st.session_state[key] = default
+
+def _collect_automation_result():
+    """Move a finished run's result from the runner into session state"""
+    result = st.session_state.test_runner.get_result()
+    if result:
+        st.session_state.automation_result = result
+        # New report folder contents: rescan the sidebar listing
+        st.session_state.pop('_reports_mtime', None)
+
+@st.fragment(run_every=1)
+def _poll_automation(headless_mode):
+    """Show live automation status; only this fragment reruns each second until the run finishes"""
+    runner = st.session_state.test_runner
+    finished = not runner.running  # The result is published before running is cleared
+    # Drain queued updates and keep only the newest; write session state only when it changes
+    latest_status = None
+    while (status_update := runner.get_status()) is not None:
+        latest_status = status_update
+    if latest_status is not None and latest_status != st.session_state.automation_status:
+        st.session_state.automation_status = latest_status
+    
+    if finished:
+        st.rerun()  # Full rerun collects and renders the result and stops polling
+    
+    if not headless_mode:
+        st.info(f"🔄 {st.session_state.automation_status} | 👁️ **Browser is visible - check your screen!**")
+    else:
+        st.info(f"🔄 {st.session_state.automation_status}")
+
+@st.fragment
+def _render_report_viewer(suffix):
+    """Render a tab's inline HTML report; closing it reruns only this fragment"""
+    show_key, path_key = f"show_report_{suffix}", f"current_report_path_{suffix}"
+    if not (st.session_state[show_key] and st.session_state[path_key]):
+        return
+    try:
+        report_path = st.session_state[path_key]
+        report_stat = _stat_or_none(report_path)
+        if report_stat is not None:
+            html_content = _load_report_embed(str(report_path), report_stat.st_mtime_ns)
+            
+            st.markdown("---")
+            st.subheader("📊 Automation Test Report")
+            
+            # Add close button
+            if st.button("❌ Close Report", key=f"close_report_{suffix}"):
+                st.session_state[show_key] = False
+                st.rerun(scope="fragment")
+            
+            # Display HTML content
+            st.components.v1.html(html_content, height=800, scrolling=True)
+            
+        else:
+            st.error("Report file not found!")
+            st.session_state[show_key] = False
+    except Exception as e:
+        st.error(f"Error loading report: {str(e)}")
+        st.session_state[show_key] = False
+
+@st.fragment
+def _render_sidebar_report():
+    """Render the report picked in the sidebar; closing it reruns only this fragment"""
+    if not (st.session_state.sidebar_show_report and st.session_state.sidebar_report_path):
+        return
+    try:
+        report_file_path = Path(st.session_state.sidebar_report_path)
+        report_stat = _stat_or_none(report_file_path)
+        if report_stat is not None:
+            mtime_ns = report_stat.st_mtime_ns
+            html_content = _load_report_embed(str(report_file_path), mtime_ns)
+            
+            st.markdown("---")
+            st.header("📊 Previous Test Report")
+            st.subheader(f"📁 {report_file_path.parent.name}")
+            
+            # Add close button
+            col_close, col_download = st.columns([1, 3])
+            with col_close:
+                if st.button("❌ Close Report", key="close_sidebar_report"):
+                    st.session_state.sidebar_show_report = False
+                    st.rerun(scope="fragment")
+            
+            with col_download:
+                st.download_button(
+                    label="📥 Download HTML Report",
+                    data=_load_report_bytes(str(report_file_path), mtime_ns),  # Cached bytes, no per-rerun encode
+                    file_name=report_file_path.name,
+                    mime="text/html",
+                    key="download_sidebar_report"
+                )
+            
+            # Display HTML content
+            st.components.v1.html(html_content, height=800, scrolling=True)
+            
+        else:
+            st.error("Report file not found!")
+            st.session_state.sidebar_show_report = False
+    except Exception as e:
+        st.error(f"Error loading report: {str(e)}")
+        st.session_state.sidebar_show_report = False
+
+def _set_state_and_rerun(**state):
+    """Apply several session-state updates together, then rerun once"""
+    st.session_state.update(state)
+    st.rerun()
+
+def _reset_csv_testing():
+    """Restart CSV row cycling and regenerate both tabs' test data from the first row"""
+    st.session_state.csv_rows_tested = 0
+    st.session_state.test_data_manager.current_row_index = 0
+    st.session_state.generated_for_tab1 = None
+    st.session_state.generated_for_tab2 = None
+    st.toast("CSV testing reset!")
+
+def _render_run_button(suffix, summary, test_case, test_data, rows_tested, total_rows, deepseek_api_key, test_url, headless_mode):
+    """Render the CSV-limit notice and "Run Test Steps" button shared by both tabs"""
+    # Check if CSV testing should continue (total_rows is None outside CSV mode)
+    csv_can_continue = True
+    if total_rows is not None and rows_tested >= total_rows:
+        csv_can_continue = False
+        st.warning(f"⏹️ All {total_rows} CSV rows have been tested. Reset to test again.")
+        # Reset in a callback so the rerun it triggers already starts from row 0
+        st.button("🔄 Reset CSV Testing", key=f"reset_csv_{suffix}", on_click=_reset_csv_testing)
+    
+    run_disabled = not deepseek_api_key or st.session_state.test_runner.running or not csv_can_continue
+    
+    if st.button("🚀 Run Test Steps", disabled=run_disabled, key=f"run_{suffix}"):
+        if not deepseek_api_key:
+            st.error("Please provide DeepSeek API key in sidebar")
+        else:
+            # Show browser mode info
+            if not headless_mode:
+                st.info("🔍 **Browser will be visible** - You can watch the automation!")
+            else:
+                st.info("⚡ **Browser running in background** - Check status below")
+            
+            # Extract test steps and run automation with test data
+            data_json = _dumps(test_data.get('data', {}), indent=True)
+            automation_task = _build_automation_task(
+                test_case, summary, test_url, data_json, test_data.get('source'), test_data
+            )
+            
+            st.info(f"🎲 Using {test_data.get('source', 'unknown')} test data with {len(test_data.get('data', {}))} fields")
+            
+            if st.session_state.test_runner.run_browser_automation(
+                test_url, automation_task, deepseek_api_key, headless_mode, test_data, data_json
+            ):
+                _set_state_and_rerun(automation_result=None, automation_owner=suffix)
+            else:
+                st.error("Another automation is already running!")
 
 def main():
     st.title("🤖 JIRA Test Case Generator & Automation")
@@ -1435,10 +1943,21 @@ def main():
         st.session_state.test_runner = BrowserTestRunner()
     if 'test_data_manager' not in st.session_state:
         st.session_state.test_data_manager = TestDataManager()
-    if 'automation_status' not in st.session_state:
-        st.session_state.automation_status = "Ready"
-    if 'automation_result' not in st.session_state:
-        st.session_state.automation_result = None
+    for key, default in {
+        **_RUN_ARTIFACT_DEFAULTS,
+        'automation_status': "Ready",
+        'automation_owner': None,
+        'created_issue_key': None,
+        'summary': None,
+        'issue_id': None,
+        'csv_rows_tested': 0,
+        'csv_load_result': None,
+        'generated_tab1': None,
+        'generated_for_tab1': None,
+        'generated_tab2': None,
+        'generated_for_tab2': None,
+    }.items():
+        st.session_state.setdefault(key, default)
     
     # Sidebar for configuration
     st.sidebar.header("Configuration")
@@ -1536,70 +2055,65 @@ def main():
             )
             
             if uploaded_file is not None:
-                success, message = st.session_state.test_data_manager.load_csv_data(uploaded_file)
+                manager = st.session_state.test_data_manager
+                # Parse the CSV only when a different file is uploaded, not on every rerun
+                if uploaded_file.file_id != manager.csv_file_id:
+                    st.session_state.csv_load_result = manager.load_csv_data(uploaded_file)
+                    manager.csv_file_id = uploaded_file.file_id
+                success, message = st.session_state.csv_load_result
                 if success:
                     st.success(message)
                     # Show CSV data preview
-                    if st.session_state.test_data_manager.csv_data is not None:
+                    if manager.preview_df is not None:
                         st.write("**Data Preview:**")
-                        st.dataframe(st.session_state.test_data_manager.csv_data.head(3))
+                        st.dataframe(manager.preview_df)
                 else:
                     st.error(message)
             else:
                 # Show sample CSV template
-                if st.button("📥 Download Sample CSV Template"):
-                    sample_df = st.session_state.test_data_manager.create_sample_csv_template()
-                    csv_string = sample_df.to_csv(index=False)
-                    st.download_button(
-                        label="Download sample_test_data.csv",
-                        data=csv_string,
-                        file_name="sample_test_data.csv",
-                        mime="text/csv"
-                    )
+                st.download_button(
+                    label="📥 Download Sample CSV Template",
+                    data=_sample_csv_bytes(),
+                    file_name="sample_test_data.csv",
+                    mime="text/csv"
+                )
         
         st.markdown("---")
         st.subheader("📊 Previous Reports")
         
+        if st.button("🧹 Clear Run Artifacts", key="clear_run_artifacts"):
+            _clear_run_artifacts()
+            st.success("Run artifacts cleared!")
+        
         # List available reports
         reports_dir = Path("automation_reports")
         if reports_dir.exists():
-            report_folders = [d for d in reports_dir.iterdir() if d.is_dir()]
-            report_folders = sorted(report_folders, key=lambda x: x.name, reverse=True)  # Most recent first
+            reports = _list_reports(reports_dir)
             
-            if report_folders:
+            if reports:
                 selected_report = st.selectbox(
                     "Select a report to view:",
-                    options=["None"] + [f.name for f in report_folders],
+                    options=["None"] + list(reports),
                     key="sidebar_report_selector"
                 )
                 
                 if selected_report != "None":
-                    selected_report_path = reports_dir / selected_report
-                    html_files = list(selected_report_path.glob("*.html"))
+                    folder_path, html_path, html_size = reports[selected_report]
                     
-                    if html_files:
-                        html_file = html_files[0]  # Take the first HTML file
-                        
+                    if html_path is not None:
                         col_view, col_open = st.columns(2)
                         with col_view:
                             if st.button("👁️ View", key="sidebar_view_report"):
                                 st.session_state.sidebar_show_report = True
-                                st.session_state.sidebar_report_path = str(html_file)
+                                st.session_state.sidebar_report_path = html_path
                         
                         with col_open:
                             if st.button("📁 Open", key="sidebar_open_report"):
-                                if platform.system() == "Darwin":  # macOS
-                                    subprocess.run(["open", str(selected_report_path)])
-                                elif platform.system() == "Windows":
-                                    subprocess.run(["explorer", str(selected_report_path)])
-                                else:  # Linux
-                                    subprocess.run(["xdg-open", str(selected_report_path)])
+                                _open_in_file_manager(folder_path)
                         
                         # Show report info
                         st.caption(f"📁 {selected_report}")
-                        if html_file.exists():
-                            file_size = html_file.stat().st_size / 1024  # KB
-                            st.caption(f"📄 {html_file.name} ({file_size:.1f} KB)")
+                        st.caption(f"📄 {os.path.basename(html_path)} ({html_size / 1024:.1f} KB)")
                     else:
                         st.caption("No HTML report found in this folder")
             else:
@@ -1612,6 +2126,12 @@ def main():
         st.markdown("• **JIRA**: [Get API Token](https://id.atlassian.com/manage-profile/security/api-tokens)")
         st.markdown("• **DeepSeek**: [Get API Key](https://platform.deepseek.com/api_keys)")
     
+    # CSV progress shared by both tabs' run buttons (total is None outside CSV mode)
+    csv_rows_tested = st.session_state.csv_rows_tested
+    csv_total_rows = None
+    if not use_faker and st.session_state.test_data_manager.csv_data is not None:
+        csv_total_rows = st.session_state.test_data_manager.total_rows
+    
     # Main tabs
     tab1, tab2 = st.tabs(["🆕 Create New Issue", "📋 Fetch Existing Issue"])
     
@@ -1658,9 +2178,10 @@ def main():
             if st.button("� Check Available Issue Types"):
                 if all([base_url, username, api_key, project_key]):
                     with st.spinner("Fetching available issue types..."):
-                        available_types, error = get_issue_types(base_url, username, api_key, project_key)
-                        if error:
-                            st.error(f"❌ {error}")
+                        try:
+                            available_types = _cached_issue_types(base_url, username, api_key, project_key)
+                        except RuntimeError as e:
+                            st.error(f"❌ {e}")
                         else:
                             st.success("✅ Available issue types:")
                             st.write(", ".join(available_types))
@@ -1684,13 +2205,14 @@ def main():
                                 st.info("💡 Try clicking 'Check Available Issue Types' to see what issue types are available for your project")
                         else:
                             st.success(f"✅ Issue created successfully: {issue_key}")
+                            _clear_run_artifacts()  # A new issue starts a new run
                             st.session_state.created_issue_key = issue_key
                             st.session_state.created_payload = payload
                             st.session_state.created_summary = feature_title
                             st.session_state.created_description = f"Feature Description: {feature_description}\nModule: {module}\nComplexity: {complexity}"
         
         with col2:
-            if hasattr(st.session_state, 'created_issue_key'):
+            if st.session_state.created_issue_key is not None:
                 st.subheader(f"📋 Created Issue: {st.session_state.created_issue_key}")
                 
                 st.subheader("📤 JSON Payload Sent")
@@ -1698,24 +2220,37 @@ def main():
                 
                 st.subheader("🧪 Generated Test Case")
                 
-                # Generate test data based on feature type
-                feature_type = st.session_state.test_data_manager.detect_feature_type(
-                    st.session_state.created_summary, 
-                    st.session_state.created_description
-                )
-                
+                # Generate test data and test case once per issue, data mode and CSV, not on every rerun
                 test_data_mode = 'faker' if use_faker else 'csv'
-                test_data = st.session_state.test_data_manager.get_test_data(
-                    feature_type, 
-                    test_data_mode
-                )
+                # The loaded CSV's file_id is part of the key so a new upload regenerates the data
+                csv_identity = None if use_faker else st.session_state.test_data_manager.csv_file_id
+                generated_for = (st.session_state.created_issue_key, test_data_mode, csv_identity)
+                if st.session_state.generated_for_tab1 != generated_for:
+                    feature_type = _detect_feature_type(
+                        st.session_state.created_summary, 
+                        st.session_state.created_description
+                    )
+                    
+                    test_data = st.session_state.test_data_manager.get_test_data(
+                        feature_type, 
+                        test_data_mode
+                    )
+                    
+                    test_case = generate_test_case(
+                        st.session_state.created_issue_key,
+                        st.session_state.created_summary,
+                        st.session_state.created_description,
+                        test_data
+                    )
+                    st.session_state.generated_tab1 = {
+                        'feature_type': feature_type,
+                        'test_data': test_data,
+                        'test_case': test_case
+                    }
+                    st.session_state.generated_for_tab1 = generated_for
                 
-                test_case = generate_test_case(
-                    st.session_state.created_issue_key,
-                    st.session_state.created_summary,
-                    st.session_state.created_description,
-                    test_data
-                )
+                test_data = st.session_state.generated_tab1['test_data']
+                test_case = st.session_state.generated_tab1['test_case']
                 
                 st.text_area("Test Case Preview", test_case, height=300, key="created_test_case")
                 
@@ -1740,130 +2275,61 @@ def main():
                     )
                 
                 with col_run_created:
-                    # Check if CSV testing should continue
-                    csv_can_continue = True
-                    if not use_faker and st.session_state.test_data_manager.csv_data is not None:
-                        rows_tested = getattr(st.session_state, 'csv_rows_tested', 0)
-                        total_rows = len(st.session_state.test_data_manager.csv_data)
-                        if rows_tested >= total_rows:
-                            csv_can_continue = False
-                            st.warning(f"⏹️ All {total_rows} CSV rows have been tested. Reset to test again.")
-                            if st.button("🔄 Reset CSV Testing", key="reset_csv"):
-                                st.session_state.csv_rows_tested = 0
-                                st.session_state.test_data_manager.current_row_index = 0
-                                st.success("CSV testing reset!")
-                                st.rerun()
-                    
-                    run_disabled = not deepseek_api_key or st.session_state.test_runner.running or not csv_can_continue
-                    
-                    if st.button("🚀 Run Test Steps", disabled=run_disabled, key="run_created"):
-                        if not deepseek_api_key:
-                            st.error("Please provide DeepSeek API key in sidebar")
-                        else:
-                            # Show browser mode info
-                            if not headless_mode:
-                                st.info("🔍 **Browser will be visible** - You can watch the automation!")
-                            else:
-                                st.info("⚡ **Browser running in background** - Check status below")
-                            
-                            # Extract test steps and run automation with test data
-                            test_steps = st.session_state.test_runner.extract_test_steps(test_case)
-                            automation_task = st.session_state.test_runner.convert_test_steps_to_automation_task(
-                                test_steps, st.session_state.created_summary, test_url, test_data
-                            )
-                            
-                            st.info(f"🎲 Using {test_data.get('source', 'unknown')} test data with {len(test_data.get('data', {}))} fields")
-                            
-                            if st.session_state.test_runner.run_browser_automation(
-                                test_url, automation_task, deepseek_api_key, headless_mode, test_data
-                            ):
-                                st.session_state.automation_result = None
-                                st.info("🚀 Starting test automation...")
-                                st.rerun()
-                            else:
-                                st.error("Another automation is already running!")
+                    _render_run_button(
+                        "created", st.session_state.created_summary, test_case, test_data,
+                        csv_rows_tested, csv_total_rows, deepseek_api_key, test_url, headless_mode
+                    )
                 
                 # Show automation status for created issue
-                if hasattr(st.session_state, 'created_issue_key'):
-                    status_update = st.session_state.test_runner.get_status()
-                    if status_update:
-                        st.session_state.automation_status = status_update
+                if st.session_state.created_issue_key is not None:
+                    owns_run = st.session_state.automation_owner == "created"
+                    if owns_run:
+                        # Drain on every pass: the run may finish before the polling fragment ticks
+                        _collect_automation_result()
+                        if st.session_state.test_runner.running:
+                            _poll_automation(headless_mode)
                     
-                    if st.session_state.test_runner.running:
-                        if not headless_mode:
-                            st.info(f"🔄 {st.session_state.automation_status} | 👁️ **Browser is visible - check your screen!**")
-                        else:
-                            st.info(f"🔄 {st.session_state.automation_status}")
-                    
-                    # Check for automation results
-                    result = st.session_state.test_runner.get_result()
+                    # Show the latest automation result for this tab
+                    result = st.session_state.automation_result if owns_run else None
                     if result:
                         if result["success"]:
                             st.success("🎉 Test automation completed successfully!")
                             
                             if result.get("report_path"):
                                 report_path = result['report_path']
+                                report_file = Path(report_path)
+                                report_stat = _stat_or_none(report_file)
                                 
                                 # Report Section with prominent buttons
                                 st.markdown("### 📊 Test Report")
-                                st.success(f"📄 Report generated: `{Path(report_path).name}`")
+                                st.success(f"📄 Report generated: `{report_file.name}`")
                                 
                                 # Make report buttons more prominent
                                 col_report1, col_report2, col_report3 = st.columns([2, 2, 1])
                                 with col_report1:
                                     if st.button("📊 **View HTML Report**", key="view_report_tab1", type="primary"):
-                                        st.session_state.show_report_tab1 = True
-                                        st.session_state.current_report_path_tab1 = report_path
-                                        st.rerun()
+                                        # The viewer fragment below renders in this same pass, so no rerun is needed
+                                        st.session_state.update(show_report_tab1=True, current_report_path_tab1=report_path)
                                 
                                 with col_report2:
                                     if st.button("📁 Open Report Directory", key="open_report_dir_tab1"):
-                                        report_dir = Path(report_path).parent
-                                        if report_dir.exists():
-                                            if platform.system() == "Darwin":  # macOS
-                                                subprocess.run(["open", str(report_dir)])
-                                            elif platform.system() == "Windows":
-                                                subprocess.run(["explorer", str(report_dir)])
-                                            else:  # Linux
-                                                subprocess.run(["xdg-open", str(report_dir)])
+                                        if _open_in_file_manager(report_file.parent):
                                             st.success("📁 Report directory opened!")
                                         else:
                                             st.error("Report directory not found!")
                                 
                                 with col_report3:
-                                    st.download_button(
-                                        label="📥 Download",
-                                        data=open(report_path, 'r', encoding='utf-8').read() if Path(report_path).exists() else "",
-                                        file_name=Path(report_path).name,
-                                        mime="text/html",
-                                        key="download_report_tab1"
-                                    )
+                                    if report_stat is not None:
+                                        st.download_button(
+                                            label="📥 Download",
+                                            data=_load_report_bytes(report_path, report_stat.st_mtime_ns),
+                                            file_name=report_file.name,
+                                            mime="text/html",
+                                            key="download_report_tab1"
+                                        )
                                 
                                 # Display HTML report inline if requested
-                                if st.session_state.get('show_report_tab1', False) and st.session_state.get('current_report_path_tab1'):
-                                    try:
-                                        report_file_path = Path(st.session_state.current_report_path_tab1)
-                                        if report_file_path.exists():
-                                            with open(report_file_path, 'r', encoding='utf-8') as f:
-                                                html_content = f.read()
-                                            
-                                            st.markdown("---")
-                                            st.subheader("📊 Automation Test Report")
-                                            
-                                            # Add close button
-                                            if st.button("❌ Close Report", key="close_report_tab1"):
-                                                st.session_state.show_report_tab1 = False
-                                                st.rerun()
-                                            
-                                            # Display HTML content
-                                            st.components.v1.html(html_content, height=800, scrolling=True)
-                                            
-                                        else:
-                                            st.error("Report file not found!")
-                                            st.session_state.show_report_tab1 = False
-                                    except Exception as e:
-                                        st.error(f"Error loading report: {str(e)}")
-                                        st.session_state.show_report_tab1 = False
+                                _render_report_viewer("tab1")
                             
                             # Visual separator
                             st.markdown("---")
@@ -1888,54 +2354,31 @@ def main():
                                 
                                 with col_pw2:
                                     if st.button("📁 Open Playwright Directory", key="open_pw_dir_tab1"):
-                                        pw_dir = playwright_info.get('directory')
-                                        if pw_dir and Path(pw_dir).exists():
-                                            if platform.system() == "Darwin":  # macOS
-                                                subprocess.run(["open", pw_dir])
-                                            elif platform.system() == "Windows":
-                                                subprocess.run(["explorer", pw_dir])
-                                            else:  # Linux
-                                                subprocess.run(["xdg-open", pw_dir])
+                                        if _open_in_file_manager(playwright_info.get('directory')):
                                             st.success("📁 Directory opened!")
                                         else:
                                             st.error("Directory not found!")
                                 
-                                # Show generated test code preview
-                                if playwright_info.get('test_suite'):
-                                    with st.expander("🎭 **Preview Generated Playwright Test Code**", expanded=False):
-                                        st.code(playwright_info['test_suite'][:2000] + "\\n\\n# ... (truncated for preview)", language='typescript')
+                                # Show generated test code preview, read lazily from the saved spec file
+                                test_file_path = playwright_info.get('test_file_path')
+                                test_file_stat = _stat_or_none(test_file_path) if test_file_path else None
+                                if test_file_stat is not None:
+                                    # A collapsed expander still builds its contents; the toggle skips them until switched on
+                                    if st.toggle("🎭 **Preview Generated Playwright Test Code**", key="pw_preview_toggle_tab1"):
+                                        st.code(_load_pw_preview(test_file_path, test_file_stat.st_mtime_ns), language='typescript')
                                         
                                         st.download_button(
                                             label="📥 Download Complete Test Suite (.ts)",
-                                            data=playwright_info['test_suite'],
+                                            data=_load_report_bytes(test_file_path, test_file_stat.st_mtime_ns),
                                             file_name=f"auto_generated_test.spec.ts",
                                             mime="text/plain",
                                             key="download_pw_test_tab1"
                                         )
                                 
                                 # Installation and usage instructions
-                                st.info("""
-**🚀 Quick Start with Generated Tests:**
-
-1. **Navigate to the Playwright directory** (use button above)
-2. **Install dependencies**: `npm install && npx playwright install`
-3. **Run tests**: `npm test` (headless) or `npm run test:headed` (visible)
-4. **Debug tests**: `npm run test:debug` or `npm run test:ui` (interactive)
-5. **View reports**: `npm run test:report`
-
-💡 **The generated tests include:**
-- Data-driven test scenarios using your test data
-- Edge case and negative testing scenarios
-- Cross-browser compatibility (Chrome, Firefox, Safari)
-- Mobile testing (Chrome Mobile, Safari Mobile)
-- Screenshots and video recording on failures
-- CI/CD ready configuration with best practices
-                                """)
-                            
-                            st.session_state.automation_result = result
+                                st.info(_QUICK_START_MD)
                         else:
                             st.error(f"❌ Test automation failed: {result['error']}")
-                        st.rerun()
             else:
                 st.info("👈 Fill in the form and click 'Create JIRA Issue' to see the results")
     
@@ -1961,14 +2404,16 @@ def main():
                         if error:
                             st.error(f"❌ {error}")
                         else:
+                            _clear_run_artifacts()  # A new issue starts a new run
                             st.session_state.summary = summary
                             st.session_state.description = description
                             st.session_state.issue_id = issue_id
+                            st.session_state.generated_for_tab2 = None  # Regenerate even when re-fetching the same issue
                             st.success("✅ Issue fetched successfully!")
         
         with col2:
             # Display fetched issue information
-            if hasattr(st.session_state, 'summary') and st.session_state.summary:
+            if st.session_state.summary:
                 st.subheader("📋 Summary")
                 st.write(st.session_state.summary)
                 
@@ -1978,24 +2423,37 @@ def main():
                 # Generate and display test case with test data
                 st.subheader("🧪 Generated Test Case")
                 
-                # Generate test data based on feature type
-                feature_type = st.session_state.test_data_manager.detect_feature_type(
-                    st.session_state.summary, 
-                    st.session_state.description
-                )
-                
+                # Generate test data and test case once per issue, data mode and CSV, not on every rerun
                 test_data_mode = 'faker' if use_faker else 'csv'
-                test_data = st.session_state.test_data_manager.get_test_data(
-                    feature_type, 
-                    test_data_mode
-                )
+                # The loaded CSV's file_id is part of the key so a new upload regenerates the data
+                csv_identity = None if use_faker else st.session_state.test_data_manager.csv_file_id
+                generated_for = (st.session_state.issue_id, test_data_mode, csv_identity)
+                if st.session_state.generated_for_tab2 != generated_for:
+                    feature_type = _detect_feature_type(
+                        st.session_state.summary, 
+                        st.session_state.description
+                    )
+                    
+                    test_data = st.session_state.test_data_manager.get_test_data(
+                        feature_type, 
+                        test_data_mode
+                    )
+                    
+                    test_case = generate_test_case(
+                        st.session_state.issue_id, 
+                        st.session_state.summary, 
+                        st.session_state.description,
+                        test_data
+                    )
+                    st.session_state.generated_tab2 = {
+                        'feature_type': feature_type,
+                        'test_data': test_data,
+                        'test_case': test_case
+                    }
+                    st.session_state.generated_for_tab2 = generated_for
                 
-                test_case = generate_test_case(
-                    st.session_state.issue_id, 
-                    st.session_state.summary, 
-                    st.session_state.description,
-                    test_data
-                )
+                test_data = st.session_state.generated_tab2['test_data']
+                test_case = st.session_state.generated_tab2['test_case']
                 
                 st.text_area("Test Case Preview", test_case, height=400, key="fetched_test_case")
                 
@@ -2020,130 +2478,61 @@ def main():
                     )
                 
                 with col_run:
-                    # Check if CSV testing should continue
-                    csv_can_continue = True
-                    if not use_faker and st.session_state.test_data_manager.csv_data is not None:
-                        rows_tested = getattr(st.session_state, 'csv_rows_tested', 0)
-                        total_rows = len(st.session_state.test_data_manager.csv_data)
-                        if rows_tested >= total_rows:
-                            csv_can_continue = False
-                            st.warning(f"⏹️ All {total_rows} CSV rows have been tested. Reset to test again.")
-                            if st.button("🔄 Reset CSV Testing", key="reset_csv"):
-                                st.session_state.csv_rows_tested = 0
-                                st.session_state.test_data_manager.current_row_index = 0
-                                st.success("CSV testing reset!")
-                                st.rerun()
-                    
-                    run_disabled = not deepseek_api_key or st.session_state.test_runner.running or not csv_can_continue
-                    
-                    if st.button("🚀 Run Test Steps", disabled=run_disabled, key="run_fetched"):
-                        if not deepseek_api_key:
-                            st.error("Please provide DeepSeek API key in sidebar")
-                        else:
-                            # Show browser mode info
-                            if not headless_mode:
-                                st.info("🔍 **Browser will be visible** - You can watch the automation!")
-                            else:
-                                st.info("⚡ **Browser running in background** - Check status below")
-                            
-                            # Extract test steps and run automation with test data
-                            test_steps = st.session_state.test_runner.extract_test_steps(test_case)
-                            automation_task = st.session_state.test_runner.convert_test_steps_to_automation_task(
-                                test_steps, st.session_state.summary, test_url, test_data
-                            )
-                            
-                            st.info(f"🎲 Using {test_data.get('source', 'unknown')} test data with {len(test_data.get('data', {}))} fields")
-                            
-                            if st.session_state.test_runner.run_browser_automation(
-                                test_url, automation_task, deepseek_api_key, headless_mode, test_data
-                            ):
-                                st.session_state.automation_result = None
-                                st.info("🚀 Starting test automation...")
-                                st.rerun()
-                            else:
-                                st.error("Another automation is already running!")
+                    _render_run_button(
+                        "fetched", st.session_state.summary, test_case, test_data,
+                        csv_rows_tested, csv_total_rows, deepseek_api_key, test_url, headless_mode
+                    )
                 
                 # Show automation status for fetched issue
-                if hasattr(st.session_state, 'issue_id'):
-                    status_update = st.session_state.test_runner.get_status()
-                    if status_update:
-                        st.session_state.automation_status = status_update
+                if st.session_state.issue_id is not None:
+                    owns_run = st.session_state.automation_owner == "fetched"
+                    if owns_run:
+                        # Drain on every pass: the run may finish before the polling fragment ticks
+                        _collect_automation_result()
+                        if st.session_state.test_runner.running:
+                            _poll_automation(headless_mode)
                     
-                    if st.session_state.test_runner.running:
-                        if not headless_mode:
-                            st.info(f"🔄 {st.session_state.automation_status} | 👁️ **Browser is visible - check your screen!**")
-                        else:
-                            st.info(f"🔄 {st.session_state.automation_status}")
-                    
-                    # Check for automation results
-                    result = st.session_state.test_runner.get_result()
+                    # Show the latest automation result for this tab
+                    result = st.session_state.automation_result if owns_run else None
                     if result:
                         if result["success"]:
                             st.success("🎉 Test automation completed successfully!")
                             
                             if result.get("report_path"):
                                 report_path = result['report_path']
+                                report_file = Path(report_path)
+                                report_stat = _stat_or_none(report_file)
                                 
                                 # Report Section with prominent buttons
                                 st.markdown("### 📊 Test Report")
-                                st.success(f"📄 Report generated: `{Path(report_path).name}`")
+                                st.success(f"📄 Report generated: `{report_file.name}`")
                                 
                                 # Make report buttons more prominent
                                 col_report1, col_report2, col_report3 = st.columns([2, 2, 1])
                                 with col_report1:
                                     if st.button("📊 **View HTML Report**", key="view_report_tab2", type="primary"):
-                                        st.session_state.show_report_tab2 = True
-                                        st.session_state.current_report_path_tab2 = report_path
-                                        st.rerun()
+                                        # The viewer fragment below renders in this same pass, so no rerun is needed
+                                        st.session_state.update(show_report_tab2=True, current_report_path_tab2=report_path)
                                 
                                 with col_report2:
                                     if st.button("📁 Open Report Directory", key="open_report_dir_tab2"):
-                                        report_dir = Path(report_path).parent
-                                        if report_dir.exists():
-                                            if platform.system() == "Darwin":  # macOS
-                                                subprocess.run(["open", str(report_dir)])
-                                            elif platform.system() == "Windows":
-                                                subprocess.run(["explorer", str(report_dir)])
-                                            else:  # Linux
-                                                subprocess.run(["xdg-open", str(report_dir)])
+                                        if _open_in_file_manager(report_file.parent):
                                             st.success("📁 Report directory opened!")
                                         else:
                                             st.error("Report directory not found!")
                                 
                                 with col_report3:
-                                    st.download_button(
-                                        label="📥 Download",
-                                        data=open(report_path, 'r', encoding='utf-8').read() if Path(report_path).exists() else "",
-                                        file_name=Path(report_path).name,
-                                        mime="text/html",
-                                        key="download_report_tab2"
-                                    )
+                                    if report_stat is not None:
+                                        st.download_button(
+                                            label="📥 Download",
+                                            data=_load_report_bytes(report_path, report_stat.st_mtime_ns),
+                                            file_name=report_file.name,
+                                            mime="text/html",
+                                            key="download_report_tab2"
+                                        )
                                 
                                 # Display HTML report inline if requested
-                                if st.session_state.get('show_report_tab2', False) and st.session_state.get('current_report_path_tab2'):
-                                    try:
-                                        report_file_path = Path(st.session_state.current_report_path_tab2)
-                                        if report_file_path.exists():
-                                            with open(report_file_path, 'r', encoding='utf-8') as f:
-                                                html_content = f.read()
-                                            
-                                            st.markdown("---")
-                                            st.subheader("📊 Automation Test Report")
-                                            
-                                            # Add close button
-                                            if st.button("❌ Close Report", key="close_report_tab2"):
-                                                st.session_state.show_report_tab2 = False
-                                                st.rerun()
-                                            
-                                            # Display HTML content
-                                            st.components.v1.html(html_content, height=800, scrolling=True)
-                                            
-                                        else:
-                                            st.error("Report file not found!")
-                                            st.session_state.show_report_tab2 = False
-                                    except Exception as e:
-                                        st.error(f"Error loading report: {str(e)}")
-                                        st.session_state.show_report_tab2 = False
+                                _render_report_viewer("tab2")
                             
                             # Visual separator
                             st.markdown("---")
@@ -2168,124 +2557,40 @@ def main():
                                 
                                 with col_pw2:
                                     if st.button("📁 Open Playwright Directory", key="open_pw_dir_tab2"):
-                                        pw_dir = playwright_info.get('directory')
-                                        if pw_dir and Path(pw_dir).exists():
-                                            if platform.system() == "Darwin":  # macOS
-                                                subprocess.run(["open", pw_dir])
-                                            elif platform.system() == "Windows":
-                                                subprocess.run(["explorer", pw_dir])
-                                            else:  # Linux
-                                                subprocess.run(["xdg-open", pw_dir])
+                                        if _open_in_file_manager(playwright_info.get('directory')):
                                             st.success("📁 Directory opened!")
                                         else:
                                             st.error("Directory not found!")
                                 
-                                # Show generated test code preview
-                                if playwright_info.get('test_suite'):
-                                    with st.expander("🎭 **Preview Generated Playwright Test Code**", expanded=False):
-                                        st.code(playwright_info['test_suite'][:2000] + "\\n\\n# ... (truncated for preview)", language='typescript')
+                                # Show generated test code preview, read lazily from the saved spec file
+                                test_file_path = playwright_info.get('test_file_path')
+                                test_file_stat = _stat_or_none(test_file_path) if test_file_path else None
+                                if test_file_stat is not None:
+                                    # A collapsed expander still builds its contents; the toggle skips them until switched on
+                                    if st.toggle("🎭 **Preview Generated Playwright Test Code**", key="pw_preview_toggle_tab2"):
+                                        st.code(_load_pw_preview(test_file_path, test_file_stat.st_mtime_ns), language='typescript')
                                         
                                         st.download_button(
                                             label="📥 Download Complete Test Suite (.ts)",
-                                            data=playwright_info['test_suite'],
+                                            data=_load_report_bytes(test_file_path, test_file_stat.st_mtime_ns),
                                             file_name=f"auto_generated_test.spec.ts",
                                             mime="text/plain",
                                             key="download_pw_test_tab2"
                                         )
                                 
                                 # Installation and usage instructions
-                                st.info("""
-**🚀 Quick Start with Generated Tests:**
-
-1. **Navigate to the Playwright directory** (use button above)
-2. **Install dependencies**: `npm install && npx playwright install`
-3. **Run tests**: `npm test` (headless) or `npm run test:headed` (visible)
-4. **Debug tests**: `npm run test:debug` or `npm run test:ui` (interactive)
-5. **View reports**: `npm run test:report`
-
-💡 **The generated tests include:**
-- Data-driven test scenarios using your test data
-- Edge case and negative testing scenarios
-- Cross-browser compatibility (Chrome, Firefox, Safari)
-- Mobile testing (Chrome Mobile, Safari Mobile)
-- Screenshots and video recording on failures
-- CI/CD ready configuration with best practices
-                                """)
-                            
-                            st.session_state.automation_result = result
+                                st.info(_QUICK_START_MD)
                         else:
                             st.error(f"❌ Test automation failed: {result['error']}")
-                        st.rerun()
             else:
                 st.info("👆 Enter issue details and click 'Fetch Issue' to generate test case")
     
     # Display sidebar report viewer
-    if st.session_state.get('sidebar_show_report', False) and st.session_state.get('sidebar_report_path'):
-        try:
-            report_file_path = Path(st.session_state.sidebar_report_path)
-            if report_file_path.exists():
-                with open(report_file_path, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                st.markdown("---")
-                st.header("📊 Previous Test Report")
-                st.subheader(f"📁 {report_file_path.parent.name}")
-                
-                # Add close button
-                col_close, col_download = st.columns([1, 3])
-                with col_close:
-                    if st.button("❌ Close Report", key="close_sidebar_report"):
-                        st.session_state.sidebar_show_report = False
-                        st.rerun()
-                
-                with col_download:
-                    st.download_button(
-                        label="📥 Download HTML Report",
-                        data=html_content,
-                        file_name=report_file_path.name,
-                        mime="text/html",
-                        key="download_sidebar_report"
-                    )
-                
-                # Display HTML content
-                st.components.v1.html(html_content, height=800, scrolling=True)
-                
-            else:
-                st.error("Report file not found!")
-                st.session_state.sidebar_show_report = False
-        except Exception as e:
-            st.error(f"Error loading report: {str(e)}")
-            st.session_state.sidebar_show_report = False
-    
-    # Live status updates
-    if st.session_state.test_runner.running:
-        time.sleep(1)
-        st.rerun()
+    _render_sidebar_report()
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    ### 🤖 **Features:**
-    - ✅ **Create JIRA Issues** - Generate issues from feature descriptions
-    - ✅ **Auto-Generate Test Cases** - Create structured manual test cases
-    - ✅ **Browser Automation** - Execute test steps automatically with BrowserClark
-    - ✅ **🔍 Visual Browser Mode** - Watch the browser in real-time during testing
-    - ✅ **Real-time Status** - Live updates during automation
-    - ✅ **Detailed Reports** - Comprehensive HTML reports with screenshots
-    
-    ### 🔧 **Requirements:**
-    - **JIRA API Token** - For issue creation and fetching
-    - **DeepSeek API Key** - For AI-powered browser automation
-    - **Target URL** - Website where tests will be executed
-    
-    ### 👁️ **Browser Visibility:**
-    - **🔍 Show Browser**: Watch the automation happen in real-time (great for debugging)
-    - **⚡ Headless Mode**: Faster execution with browser running in background
-    
-    💡 **Tip**: Use "Show Browser" mode to see exactly what the AI is doing on your website!
-    
-    *Built with Streamlit & BrowserClark* 🚀
-    """)
+    st.markdown(_FOOTER_MD)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file